@@ -1,5 +1,4 @@
 import argparse
-import re
 
 from pkglink.models import ParsedSource
 from pkglink.parsing import (
@@ -42,14 +41,13 @@ def argparse_source(value: str) -> ParsedSource:
             name=name,
         )
     # Accept as package
-    package_match = re.match(r'^([^@]+)(?:@(.+))?$', value)
-    if not package_match:
+    name, at, version = value.partition('@')
+    if not name or (at and not version):
         msg = f'Invalid pypi package source format: {value}'
         raise argparse.ArgumentTypeError(msg)
-    name, version = package_match.groups()
     return ParsedSource(
         source_type='package',
         raw=value,
         name=name,
-        version=version,
+        version=version or None,
     )
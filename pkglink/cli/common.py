@@ -11,6 +11,7 @@ from hotlog.live import LiveLogger, maybe_live_logging
 
 from pkglink.execution_plan import execute_plan, generate_execution_plan
 from pkglink.installation import install_with_uvx
+from pkglink.log_context import verbose_kwargs
 from pkglink.models import BaseCliArgs, ExecutionPlan, PkglinkContext
 from pkglink.parsing import create_pkglink_context
 from pkglink.setup import run_post_install_setup
@@ -90,19 +91,26 @@ def setup_logging_and_handle_errors(*, verbose: int) -> None:
     )
 
 
-def run_post_install_from_plan(plan: ExecutionPlan) -> list[dict[str, str]]:
-    """Run post-install setup steps based on an execution plan."""
+def run_post_install_from_plan(
+    plan: ExecutionPlan,
+    cwd: Path | None = None,
+) -> list[dict[str, str]]:
+    """Run post-install setup steps based on an execution plan.
+
+    Args:
+        plan: The executed plan whose package should be set up
+        cwd: Project directory the links live in (defaults to the current directory)
+    """
     context = plan.context
     if context.cli_args.no_setup:
         return []
 
+    base_dir = cwd or Path.cwd()
     symlink_name = context.resolved_symlink_name
     if context.inside_pkglink:
-        linked_path = Path.cwd() / '.pkglink' / symlink_name
-        base_dir = Path.cwd()
+        linked_path = base_dir / '.pkglink' / symlink_name
     else:
-        linked_path = Path.cwd() / symlink_name
-        base_dir = Path.cwd()
+        linked_path = base_dir / symlink_name
 
     return run_post_install_setup(linked_path, base_dir)
 
@@ -126,7 +134,7 @@ def download_phase(entries: list[WorkflowEntry]) -> None:
                     'download_entry_start',
                     entry=entry.label,
                     _display_level=1,
-                    _verbose_install_spec=context.install_spec.model_dump(),
+                    **verbose_kwargs(_verbose_install_spec=context.install_spec.model_dump),
                 )
 
             cache_dir, dist_info_name, _ = install_with_uvx(
@@ -13,6 +13,7 @@ from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from pkglink.argparse import argparse_directory, argparse_source
 from pkglink.models import ParsedSource, PkglinkBatchCliArgs, PkglinkContext
 from pkglink.parsing import create_pkglink_context
+from pkglink.yaml_loader import load_yaml
 
 logger = get_logger(__name__)
 
@@ -100,8 +101,8 @@ def _load_yaml_config(config_path: Path) -> dict[str, Any]:
 
     logger.debug('loading_config', config=str(config_path))
     try:
-        with config_path.open() as fh:
-            data = yaml.safe_load(fh) or {}
+        with config_path.open('rb') as fh:
+            data = load_yaml(fh) or {}
     except yaml.YAMLError as exc:
         msg = f'failed to parse YAML: {exc}'
         raise PkglinkConfigError(msg) from exc
@@ -1,4 +1,5 @@
 import hashlib
+import os
 from pathlib import Path
 
 import yaml
@@ -32,15 +33,14 @@ def _plan_base_directory(context: PkglinkContext, plan: ExecutionPlan) -> Path:
     Returns:
         Path to the base directory for operations
     """
+    base_dir = Path.cwd()
     if context.inside_pkglink:
-        base_dir = Path.cwd() / '.pkglink'
+        base_dir /= '.pkglink'
         plan.add_operation(
             'create_directory',
             target_path=base_dir,
             description="Create .pkglink directory if it doesn't exist",
         )
-    else:
-        base_dir = Path.cwd()
 
     return base_dir
 
@@ -399,7 +399,7 @@ def _generate_metadata_content(plan: ExecutionPlan) -> dict:
         'package_name': plan.context.module_name,
         'console_scripts': plan.package_info.console_scripts if plan.package_info else {},
         'dependencies': plan.package_info.dependencies or [] if plan.package_info else [],
-        'last_refreshed': str(Path().cwd()),
+        'last_refreshed': os.getcwd(),  # noqa: PTH109 - stored as a plain string
     }
 
 
@@ -1,17 +1,22 @@
 import contextlib
 import hashlib
+import os
 import re
 import shutil
 from pathlib import Path
 
 from hotlog import get_logger
 
+from pkglink.log_context import verbose_kwargs
 from pkglink.models import SourceSpec
 from pkglink.parsing import build_uv_install_spec
 from pkglink.uvx import get_site_packages_path
 
 logger = get_logger(__name__)
 
+_COMMIT_HASH_RE = re.compile(r'^[a-f0-9]{40}$')
+_SEMVER_TAG_RE = re.compile(r'^v?\d+\.\d+\.\d+')
+
 
 def _is_immutable_reference(spec: SourceSpec) -> bool:
     """Check if a source specification refers to an immutable reference that can be cached indefinitely."""
@@ -21,10 +26,10 @@ def _is_immutable_reference(spec: SourceSpec) -> bool:
 
     if spec.source_type == 'github' and spec.version:
         # GitHub with commit hash (40 char hex) - immutable
-        if re.match(r'^[a-f0-9]{40}$', spec.version):
+        if _COMMIT_HASH_RE.match(spec.version):
             return True
         # GitHub with semver-like version tag - generally immutable
-        if re.match(r'^v?\d+\.\d+\.\d+', spec.version):
+        if _SEMVER_TAG_RE.match(spec.version):
             return True
 
     # Everything else (branches, latest packages) - mutable
@@ -158,11 +163,12 @@ def find_package_root(
         install_dir=str(install_dir),
     )
 
-    # List all items for debugging
-    items = list(install_dir.iterdir())
+    # List all items for debugging; DirEntry caches the file type from the directory read
+    with os.scandir(install_dir) as it:
+        entries = list(it)
     logger.debug(
         'available_items_in_install_directory',
-        items=[item.name for item in items],
+        items=[entry.name for entry in entries],
         looking_for_subdir=target_subdir,
     )
 
@@ -186,7 +192,7 @@ def find_package_root(
         return result
 
     # If exact match fails, clarify if package exists but subdir is missing
-    package_exists = any(item.name == expected_name and item.is_dir() for item in items)
+    package_exists = any(entry.name == expected_name and entry.is_dir() for entry in entries)
     if package_exists:
         message = f"Package '{expected_name}' found, but subdirectory '{target_subdir}' is missing in {install_dir}"
         warning_type = 'package_subdir_not_found'
@@ -201,9 +207,9 @@ def find_package_root(
         target_subdir=target_subdir,
         suggestion='use of --from may be needed to specify correct module',
         available_directories=[
-            item.name
-            for item in items
-            if item.is_dir() and not item.name.startswith('.') and not item.name.endswith('.dist-info')
+            entry.name
+            for entry in entries
+            if entry.is_dir() and not entry.name.startswith('.') and not entry.name.endswith('.dist-info')
         ],
     )
     raise RuntimeError(message)
@@ -410,7 +416,7 @@ def install_with_uvx(spec: SourceSpec) -> tuple[Path, str, Path | None]:
     logger.debug(
         'install_spec',
         spec=install_spec,
-        _verbose_source_spec=spec.model_dump(),
+        **verbose_kwargs(_verbose_source_spec=spec.model_dump),
     )
 
     cache_dir = _create_cache_directory(spec, install_spec)
@@ -0,0 +1,25 @@
+"""Helpers for building structured log context."""
+
+from collections.abc import Callable
+from typing import Any
+
+from hotlog.config import get_config
+
+
+def verbose_kwargs(**factories: Callable[[], Any]) -> dict[str, Any]:
+    """Build ``_verbose_`` log kwargs only when hotlog would display them.
+
+    Values are zero-argument callables (e.g. a bound ``model_dump``) so the
+    payload is never built when verbose output is disabled and hotlog would
+    drop the keys anyway. The check uses hotlog's global verbosity, which is
+    what its filtering uses, not per-entry CLI arguments.
+
+    Args:
+        **factories: Log keys mapped to callables producing their values
+
+    Returns:
+        The evaluated kwargs when verbose, otherwise an empty dict
+    """
+    if not get_config().verbosity_level:
+        return {}
+    return {key: factory() for key, factory in factories.items()}
@@ -7,6 +7,8 @@ from pydantic import BaseModel, ConfigDict, StringConstraints
 class PackageInfo(BaseModel):
     """Information extracted from a package's dist-info directory."""
 
+    model_config = ConfigDict(frozen=True)
+
     version: str
     console_scripts: dict[str, str] = {}
     metadata: dict[str, str] = {}
@@ -16,6 +18,8 @@ class PackageInfo(BaseModel):
 class ParsedSource(BaseModel):
     """Intermediate validated source info for CLI parsing."""
 
+    model_config = ConfigDict(frozen=True)
+
     source_type: Literal['github', 'package', 'local']
     name: str
     raw: str
@@ -29,6 +33,8 @@ class ParsedSource(BaseModel):
 class SourceSpec(BaseModel):
     """Represents a parsed source specification."""
 
+    model_config = ConfigDict(frozen=True)
+
     source_type: Literal['github', 'package', 'local']
     name: Annotated[str, StringConstraints(min_length=1, strip_whitespace=True)]
     version: str | None = None
@@ -61,6 +67,7 @@ class LinkTarget(BaseModel):
     """Represents the target for a symlink operation."""
 
     model_config = ConfigDict(
+        frozen=True,
         # Serialize Path objects as strings
         json_encoders={Path: str},
     )
@@ -77,6 +84,7 @@ class LinkOperation(BaseModel):
     """Represents a complete link operation."""
 
     model_config = ConfigDict(
+        frozen=True,
         # Serialize Path objects as strings
         json_encoders={Path: str},
     )
@@ -90,6 +98,8 @@ class LinkOperation(BaseModel):
 class BaseCliArgs(BaseModel):
     """Base command line arguments model with common fields."""
 
+    model_config = ConfigDict(frozen=True)
+
     source: ParsedSource  # Validated source spec (github, package, or local)
     directory: str = 'resources'  # Target directory name within the package
     symlink_name: str | None = None  # Custom name for the symlink (defaults to .{source})
@@ -150,6 +160,8 @@ class PkglinkContext(BaseModel):
     - cli_args: the original CLI arguments (CliArgs or PkglinkxCliArgs)
     """
 
+    model_config = ConfigDict(frozen=True)
+
     # What to install
     install_spec: SourceSpec
 
@@ -212,9 +224,9 @@ class PkglinkContext(BaseModel):
             return self.cli_args.symlink_name
         # For GitHub sources, default to repo name (install_spec.name)
         if self.source_type in ('github', 'local'):
-            return f'.{self.install_spec.name}'
+            return '.' + self.install_spec.name
         # Otherwise, use .{module_name}
-        return f'.{self.module_name}'
+        return '.' + self.module_name
 
     @property
     def source_type(self) -> str:
@@ -321,6 +333,8 @@ class PkglinkContext(BaseModel):
 class FileOperation(BaseModel):
     """Represents a file operation to be performed."""
 
+    model_config = ConfigDict(frozen=True)
+
     operation_type: Literal['create_file', 'create_symlink', 'create_directory']
     source_path: Path | None = None  # For symlinks
     target_path: Path
@@ -1,8 +1,10 @@
-import re
-from pathlib import Path
+import functools
+import string
+from pathlib import Path, PurePosixPath
 
 from hotlog import get_logger
 
+from pkglink.log_context import verbose_kwargs
 from pkglink.models import (
     BaseCliArgs,
     ParsedSource,
@@ -12,12 +14,17 @@ from pkglink.models import (
 
 logger = get_logger(__name__)
 
+# First characters that mark a POSIX-style local path ('.', '/', '~').
+_LOCAL_START_CHARS = frozenset('./~')
+_DRIVE_LETTERS = frozenset(string.ascii_letters)
 
-def parse_source(
+
+@functools.lru_cache(maxsize=256)
+def _parse_source_cached(
     source: ParsedSource,
-    project_name: str | None = None,
+    project_name: str | None,
 ) -> SourceSpec:
-    """Convert a ParsedSource object into a SourceSpec, always setting project_name."""
+    # Inputs and result are frozen models, so cached specs can be shared safely.
     # Ensure required fields are present and fallback to empty string if needed
     if source.source_type == 'github':
         return SourceSpec(
@@ -43,6 +50,14 @@ def parse_source(
     )
 
 
+def parse_source(
+    source: ParsedSource,
+    project_name: str | None = None,
+) -> SourceSpec:
+    """Convert a ParsedSource object into a SourceSpec, always setting project_name."""
+    return _parse_source_cached(source, project_name)
+
+
 def is_local_path(source: str) -> bool:
     """Check if the source string represents a local path.
 
@@ -52,12 +67,12 @@ def is_local_path(source: str) -> bool:
     Returns:
         True if the source is a local path, False otherwise.
     """
-    return (
-        source in ('.', './')
-        or source.startswith(('./', '/', '~'))
-        or Path(source).is_absolute()
-        or re.match(r'^[A-Za-z]:[/\\]', source) is not None  # Windows absolute path
-    )
+    return source[:1] in _LOCAL_START_CHARS or _is_windows_absolute(source) or Path(source).is_absolute()
+
+
+def _is_windows_absolute(source: str) -> bool:
+    """Check for a drive-letter path such as ``C:\\`` or ``C:/``."""
+    return source[:1] in _DRIVE_LETTERS and source[1:2] == ':' and source[2:3] in ('/', '\\')
 
 
 def extract_local_name(source: str) -> str:
@@ -70,8 +85,8 @@ def extract_local_name(source: str) -> str:
         The name of the directory at the end of the path.
     """
     # Handle Windows paths on non-Windows systems
-    if re.match(r'^[A-Za-z]:[/\\]', source):
-        return source.replace('\\', '/').split('/')[-1]
+    if _is_windows_absolute(source):
+        return PurePosixPath(source.replace('\\', '/').rstrip('/')).name or source
 
     path = Path(source).expanduser()
     # For current directory references, resolve to get the actual name
@@ -89,33 +104,56 @@ def parse_github_source(value: str) -> tuple[ParsedSource | None, str]:
     Returns:
         A tuple of (ParsedSource or None, error message string).
     """
-    m = re.match(r'^github:([^/]+)/([^@/]+)(?:@(.+))?$', value)
-    if not m:
-        return None, f'Invalid Github source format: {value}'
-    org, repo, version = m.groups()
-    if not org.strip() or not repo.strip():
+    scheme, colon, spec = value.partition(':')
+    org, slash, repo_spec = spec.partition('/')
+    repo, at, version = repo_spec.partition('@')
+    invalid = (
+        scheme != 'github'
+        or not colon
+        or not slash
+        or not org.strip()
+        or not repo.strip()
+        or '/' in repo
+        or (at and not version)
+    )
+    if invalid:
         return None, f'Invalid Github source format: {value}'
     return ParsedSource(
         source_type='github',
         raw=value,
         org=org,
         repo=repo,
-        version=version,
+        version=version or None,
         name=repo,
     ), ''
 
 
+@functools.lru_cache(maxsize=512)
+def _build_remote_uv_spec(
+    source_type: str,
+    name: str,
+    org: str | None,
+    version: str | None,
+) -> str:
+    if source_type == 'github':
+        base_url = f'git+https://github.com/{org}/{name}.git'
+        return f'{base_url}@{version}' if version else base_url
+    return f'{name}=={version}' if version else name
+
+
 def build_uv_install_spec(spec: SourceSpec) -> str:
     """Build UV install specification from source spec."""
-    if spec.source_type == 'github':
-        base_url = f'git+https://github.com/{spec.org}/{spec.name}.git'
-        return f'{base_url}@{spec.version}' if spec.version else base_url
-
-    if spec.source_type == 'package':
-        return f'{spec.name}=={spec.version}' if spec.version else spec.name
+    if spec.source_type in ('github', 'package'):
+        return _build_remote_uv_spec(
+            spec.source_type,
+            spec.name,
+            spec.org,
+            spec.version,
+        )
 
     if spec.source_type == 'local':
         # For local sources, resolve the path and return it for uvx installation
+        # (not cached, since relative paths depend on the working directory)
         # Use local_path if available, otherwise fall back to name for backwards compatibility
         source_path = spec.local_path or spec.name
         path = Path(source_path).resolve()
@@ -157,7 +195,7 @@ def create_pkglink_context(args: BaseCliArgs) -> PkglinkContext:
         source_type=install_spec.source_type,
         version=install_spec.version,
         module_name=module_name,
-        _verbose_source_spec=install_spec.model_dump(),
+        **verbose_kwargs(_verbose_source_spec=install_spec.model_dump),
     )
 
     return PkglinkContext(
@@ -1,13 +1,13 @@
 """Post-install setup functionality for pkglink."""
 
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
-import yaml
 from hotlog import get_logger
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from pkglink.symlinks import create_symlink
+from pkglink.yaml_loader import load_yaml
 
 logger = get_logger(__name__)
 
@@ -15,6 +15,8 @@ logger = get_logger(__name__)
 class SymlinkSpec(BaseModel):
     """Specification for a single symlink."""
 
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     source: str
     target: str
 
@@ -22,19 +24,26 @@ class SymlinkSpec(BaseModel):
 class PostInstallConfig(BaseModel):
     """Configuration for post-install setup."""
 
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     symlinks: list[SymlinkSpec] = []
 
 
-def _load_yaml_config(config_path: Path) -> dict[str, Any]:
-    """Load and parse YAML configuration file."""
-    with config_path.open() as f:
-        return yaml.safe_load(f) or {}
+def _load_yaml_config(config_file: IO[bytes]) -> dict[str, Any]:
+    """Load and parse an open YAML configuration file."""
+    return load_yaml(config_file) or {}
 
 
-def _find_config_file(linked_path: Path) -> Path | None:
-    """Find pkglink.yaml configuration file in linked directory."""
-    config_path = linked_path / 'pkglink.yaml'
-    return config_path if config_path.exists() else None
+def _open_config_file(linked_path: Path) -> IO[bytes] | None:
+    """Open pkglink.yaml in the linked directory, or return None if it is absent.
+
+    Opening directly avoids a separate existence probe before the read. The file
+    is opened in binary mode so the YAML reader decodes it without an extra copy.
+    """
+    try:
+        return (linked_path / 'pkglink.yaml').open('rb')
+    except (FileNotFoundError, NotADirectoryError):
+        return None
 
 
 def _create_additional_symlink(
@@ -83,22 +92,22 @@ def run_post_install_setup(
     Returns a list describing any additional symlinks created.
     """
     created_symlinks: list[dict[str, str]] = []
-    config_path = _find_config_file(linked_path)
-    if not config_path:
-        logger.debug(
-            'no_post_install_config_found',
-            linked_path=str(linked_path),
-        )
-        return created_symlinks
-
-    logger.info(
-        'running_post_install_setup',
-        config_path=str(config_path),
-        _display_level=1,
-    )
-
     try:
-        yaml_data = _load_yaml_config(config_path)
+        config_file = _open_config_file(linked_path)
+        if config_file is None:
+            logger.debug(
+                'no_post_install_config_found',
+                linked_path=str(linked_path),
+            )
+            return created_symlinks
+
+        logger.info(
+            'running_post_install_setup',
+            config_path=config_file.name,
+            _display_level=1,
+        )
+        with config_file:
+            yaml_data = _load_yaml_config(config_file)
         config = PostInstallConfig.model_validate(yaml_data)
         created_symlinks = _process_symlinks(config, linked_path, base_dir)
         logger.info(
@@ -1,5 +1,6 @@
 """Symlink management utilities."""
 
+import functools
 import os
 import shutil
 import tempfile
@@ -9,6 +10,9 @@ from hotlog import get_logger
 
 logger = get_logger(__name__)
 
+# os.symlink availability is fixed for the lifetime of the interpreter.
+_SUPPORTS_SYMLINKS = hasattr(os, 'symlink')
+
 
 def _cleanup_symlink_test(
     test_link: Path,
@@ -23,8 +27,13 @@ def _cleanup_symlink_test(
         pass
 
 
+@functools.cache
 def _can_create_symlink_in_tmpdir() -> bool:  # pragma: no cover - Windows-specific
-    """Attempt to create a symlink in a temp dir. Return True if successful, False otherwise."""
+    """Attempt to create a symlink in a temp dir. Return True if successful, False otherwise.
+
+    The result reflects process privileges rather than project state, so it is
+    probed once per run.
+    """
     with tempfile.TemporaryDirectory() as tmpdir:
         test_path = Path(tmpdir) / 'symlink_test_target'
         test_link = Path(tmpdir) / 'symlink_test_link'
@@ -40,13 +49,44 @@ def _can_create_symlink_in_tmpdir() -> bool:  # pragma: no cover - Windows-speci
 
 def supports_symlinks() -> bool:
     """Check if the current system supports symlinks (and has permission)."""
-    if not hasattr(os, 'symlink'):
+    if not _SUPPORTS_SYMLINKS:
         return False
     if os.name != 'nt':
         return True  # pragma: no cover - Winddows will not hit this line
     return _can_create_symlink_in_tmpdir()  # pragma: no cover - Windows-specific
 
 
+def _is_symlink_to(target: Path, source: Path) -> bool:
+    """Check whether target is already a symlink to an existing source.
+
+    Compares the raw link text first (a single readlink) and only falls back to
+    resolving both paths when the text differs, e.g. relative vs absolute links.
+    """
+    try:
+        raw = target.readlink()
+    except OSError:
+        return False
+    if not source.exists():
+        return False
+    if raw == source:
+        return True
+    return os.path.realpath(target) == os.path.realpath(source)
+
+
+def _fast_copy(src: str | Path, dst: str | Path) -> None:
+    """Hard-link a file when possible, otherwise copy it with its metadata.
+
+    A hard link avoids reading and writing the file contents and, like the symlink
+    it stands in for, keeps pointing at the same data. Linking fails across
+    filesystems or where hard links are unsupported, in which case shutil.copy2
+    (which uses the kernel fast-copy path where available) does the copy.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 def create_symlink(
     source: Path,
     target: Path,
@@ -58,19 +98,27 @@ def create_symlink(
 
     Returns True if symlink was created, False if fallback copy was used.
     """
+    # Convert once; Path objects are only kept for removal checks and parent creation
+    src = os.fspath(source)
+    tgt = os.fspath(target)
     logger.info(
         'creating_symlink',
-        target=str(target),
-        source=str(source),
+        target=tgt,
+        source=src,
         _verbose_force=force,
         _display_level=1,
     )
 
-    if target.exists():
+    if force and supports_symlinks() and _is_symlink_to(target, source):
+        logger.info('symlink_already_up_to_date', _display_level=1)
+        return True
+
+    # lexists also sees dangling symlinks, which symlink creation would trip over
+    if os.path.lexists(tgt):
         if force:
             logger.info(
                 'removing_existing_target',
-                target=str(target),
+                target=tgt,
                 _display_level=1,
             )
             remove_target(
@@ -79,33 +127,32 @@ def create_symlink(
                 allow_additional_symlink_removal=allow_additional_symlink_removal,
             )
         else:
-            logger.error('target_already_exists', target=str(target))
-            msg = f'Target already exists: {target}'
+            logger.error('target_already_exists', target=tgt)
+            msg = f'Target already exists: {tgt}'
             raise FileExistsError(msg)
 
     if not source.exists():
-        logger.error('source_does_not_exist', source=str(source))
-        msg = f'Source does not exist: {source}'
+        logger.error('source_does_not_exist', source=src)
+        msg = f'Source does not exist: {src}'
         raise FileNotFoundError(msg)
 
+    source_is_dir = source.is_dir()
+    # Ensure parent directories exist for the target
+    target.parent.mkdir(parents=True, exist_ok=True)
     if supports_symlinks():
         logger.debug('creating_symlink_using_os_symlink')
-        # Ensure parent directories exist for the target
-        target.parent.mkdir(parents=True, exist_ok=True)
-        target.symlink_to(source, target_is_directory=source.is_dir())
+        target.symlink_to(source, target_is_directory=source_is_dir)
         logger.info('symlink_created_successfully', _display_level=1)
         return True
 
     # Fallback to copying
     logger.debug('symlinks_not_supported_falling_back_to_copy')
-    # Ensure parent directories exist for the target
-    target.parent.mkdir(parents=True, exist_ok=True)
-    if source.is_dir():
+    if source_is_dir:
         logger.debug('copying_directory_tree')
-        shutil.copytree(source, target)
+        shutil.copytree(src, tgt, copy_function=_fast_copy)
     else:
         logger.debug('copying_file')
-        shutil.copy2(source, target)
+        _fast_copy(src, tgt)
     logger.info('copy_created_successfully', _display_level=1)
     return False
 
@@ -113,7 +160,7 @@ def create_symlink(
 def _check_not_dot_or_dotdot(
     resolved_name: str,
     target: Path,
-    resolved_target: Path,
+    resolved_target: str,
 ) -> None:
     # Defensive: This check is not practically reachable via normal filesystem operations,
     # because you cannot create files or directories named '.' or '..'. These are always interpreted
@@ -123,7 +170,7 @@ def _check_not_dot_or_dotdot(
         logger.error(
             'refusing_to_remove_dot_or_dotdot',
             target=str(target),
-            resolved_target=str(resolved_target),
+            resolved_target=resolved_target,
             resolved_name=resolved_name,
         )
         msg = f"Refusing to remove '{resolved_name}' (resolved from {target})"
@@ -162,12 +209,12 @@ def _check_path_traversal(target_name: str, target: Path) -> None:
 
 
 def _check_common_removal_safety(target: Path) -> None:
-    cwd = Path.cwd().resolve()
+    cwd = os.path.realpath(os.getcwd())  # noqa: PTH109 - plain str path
     # Check the symlink's location, not its resolved destination
-    if not str(target).startswith(str(cwd)):
+    if not str(target).startswith(cwd):
         msg = f'Refusing to remove target outside working directory: {target}'
         raise ValueError(msg)
-    if any(part == '.git' for part in target.parts):
+    if '.git' in target.parts:
         msg = 'Refusing to remove .git directory or its contents'
         raise ValueError(msg)
 
@@ -182,7 +229,7 @@ def _check_normal_removal(
     target_name: str,
     target: Path,
     resolved_name: str,
-    resolved_target: Path,
+    resolved_target: str,
     expected_name: str,
 ) -> None:
     _check_not_dot_or_dotdot(resolved_name, target, resolved_target)
@@ -205,12 +252,13 @@ def remove_target(
     4. For normal: run all checks
     """
     target_name = target.name
-    resolved_target = target.resolve()
-    resolved_name = resolved_target.name
     _check_common_removal_safety(target)
     if allow_additional_symlink_removal:
         _check_additional_symlink_removal(target)
     else:
+        # Only the normal checks need the resolved path; additional links skip the realpath walk
+        resolved_target = os.path.realpath(target)
+        resolved_name = Path(resolved_target).name
         _check_normal_removal(
             target_name,
             target,
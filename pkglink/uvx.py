@@ -9,6 +9,8 @@ from hotlog import get_logger
 
 logger = get_logger(__name__)
 
+_DIST_INFO_PATH_RE = re.compile(r'at: (.*[\\/][^\\/]+\.dist-info)')
+
 
 def _run_uvx_subprocess(cmd: list[str]) -> subprocess.CompletedProcess[str]:
     """Internal helper to run uvx subprocess commands safely.
@@ -86,7 +88,7 @@ def _extract_dist_info_path(
     for line in stderr_lines:
         if 'Looking at `.dist-info` at:' in line:
             # Extract the full path from the line
-            match = re.search(r'at: (.*[\\/][^\\/]+\.dist-info)', line)
+            match = _DIST_INFO_PATH_RE.search(line)
             if match:
                 full_path = match.group(1).strip()
                 dist_info_name = Path(full_path).parts[-1]
@@ -0,0 +1,15 @@
+"""Shared YAML loading using libyaml when available."""
+
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader
+
+
+def load_yaml(stream: IO[bytes]) -> Any:  # noqa: ANN401 - YAML documents are untyped
+    """Parse a YAML document from a binary stream with the safe loader."""
+    return yaml.load(stream, Loader=SafeLoader)
@@ -3,7 +3,7 @@ import os
 import re
 import subprocess
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -14,6 +14,21 @@ from pytest_mock import MockerFixture
 from pkglink.cli.pkglink import main as pkglink_main
 
 
+@pytest.fixture(autouse=True)
+def isolated_logging() -> Iterator[logging.Logger]:
+    """Restore root logger handlers and level after each test.
+
+    The CLI entry points call hotlog's configure_logging, which replaces the
+    root handlers; snapshot them once here instead of clearing per test.
+    """
+    root = logging.getLogger()
+    saved_handlers = root.handlers[:]
+    saved_level = root.level
+    yield root
+    root.handlers = saved_handlers
+    root.setLevel(saved_level)
+
+
 def strip_ansi(text: str) -> str:
     """Remove ANSI color codes from text."""
     return re.sub(r'\x1b\[[0-9;]*m', '', text)
@@ -42,7 +57,7 @@ class Result(BaseModel):
         return (self.stdout or '') + (self.stderr or '') + (self.log or '')
 
 
-@dataclass
+@dataclass(slots=True)
 class RunCommandContext:
     cli_name: str
     main_func: Callable
@@ -6,7 +6,7 @@ import pytest
 from .conftest import CliCommand, assert_contains_all
 
 
-@dataclass
+@dataclass(slots=True)
 class PkgLinkErrorCase:
     name: str
     args: list[str]
@@ -7,7 +7,7 @@ import pytest
 from .conftest import CliCommand, assert_exists_and_type
 
 
-@dataclass
+@dataclass(slots=True)
 class PkgLinkTestCase:
     name: str
     pkglink_args: list[str]
@@ -247,7 +247,7 @@ def test_pkglink_new_name(tmp_path: Path, run_pkglink: CliCommand) -> None:
     assert not pkglink_dir.exists()
 
 
-@dataclass
+@dataclass(slots=True)
 class PkgLinkErrorCase:
     name: str
     args: list[str]
@@ -8,7 +8,7 @@ from pytest_mock import MockerFixture
 from .conftest import CliCommand, assert_exists_and_type, run_uvx
 
 
-@dataclass
+@dataclass(slots=True)
 class PkgLinkExpected:
     module: str
     symlink: str
@@ -16,7 +16,7 @@ class PkgLinkExpected:
     contents: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class PkgLinkxTestCase:
     name: str
     pkglinkx_args: list[str]
@@ -154,13 +154,13 @@ def test_pkglinkx_needs_project_name(
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class RepoVersionCase:
     version: str
     expected_output: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GithubRepo:
     org: str
     repo: str
@@ -273,7 +273,7 @@ def test_pkglinkx_metadata_tracking(tmp_path: Path, run_pkglinkx: CliCommand):
     assert new_metadata['source_hash'] != first_hash
 
 
-@dataclass
+@dataclass(slots=True)
 class PkgLinkxErrorCase:
     name: str
     args: list[str]
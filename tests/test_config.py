@@ -12,12 +12,25 @@ from pkglink.config import (
     load_contexts,
 )
 
+VALID_YAML = """\
+github:
+  example/integration: master
+"""
+
 
 @pytest.fixture
 def config_path(tmp_path: Path) -> Path:
     return tmp_path / DEFAULT_CONFIG_FILENAME
 
 
+@pytest.fixture(scope='module')
+def valid_config_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # Shared by tests that only read the config; never write to it.
+    path = tmp_path_factory.mktemp('cfg') / DEFAULT_CONFIG_FILENAME
+    path.write_text(VALID_YAML)
+    return path
+
+
 def write_config(path: Path, content: str) -> None:
     path.write_text(dedent(content).lstrip())
 
@@ -105,21 +118,29 @@ def test_invalid_yaml_raises(config_path: Path) -> None:
         load_config(config_path)
 
 
-def test_build_contexts_accepts_loaded_config(config_path: Path) -> None:
-    write_config(
-        config_path,
-        """
-        github:
-          example/integration: master
-        """,
+def test_build_contexts_accepts_loaded_config(valid_config_path: Path) -> None:
+    config, normalized_links = load_config(valid_config_path)
+    contexts = build_contexts(
+        config,
+        normalized_links,
+        config_path=valid_config_path,
     )
-
-    config, normalized_links = load_config(config_path)
-    contexts = build_contexts(config, normalized_links, config_path=config_path)
     assert len(contexts) == 1
     assert contexts[0].entry_name == 'integration'
 
 
+def test_global_overrides_apply(valid_config_path: Path) -> None:
+    contexts = load_contexts(
+        config_path=valid_config_path,
+        global_verbose=2,
+        global_dry_run=True,
+    )
+
+    assert len(contexts) == 1
+    assert contexts[0].cli_args.verbose == 2
+    assert contexts[0].cli_args.dry_run is True
+
+
 def test_duplicate_project_names_raise(config_path: Path) -> None:
     write_config(
         config_path,
@@ -1,89 +1,171 @@
 """Tests for pkglink parsing functionality."""
 
-from dataclasses import dataclass
+import argparse
+from pathlib import Path
 
 import pytest
+from hotlog.config import get_config
+from pytest_mock import MockerFixture
 
+from pkglink import parsing
 from pkglink.argparse import argparse_source
-from pkglink.models import SourceSpec
+from pkglink.models import PkglinkCliArgs, SourceSpec
+from pkglink.parsing import build_uv_install_spec, create_pkglink_context, parse_source
 
+PARSE_CASES: tuple[tuple[str, str, str, str | None, str | None], ...] = (
+    # Each case: source, expected type, name, org and version.
+    ('github:myorg/myrepo', 'github', 'myrepo', 'myorg', None),
+    ('github:myorg/myrepo@v1.0.0', 'github', 'myrepo', 'myorg', 'v1.0.0'),
+    ('./local/path', 'local', 'path', None, None),
+    ('../sibling/path', 'local', 'path', None, None),
+    ('/absolute/path', 'local', 'path', None, None),
+    ('~/home/path', 'local', 'path', None, None),
+    ('C:\\\\Users\\\\test\\\\fake_toolbelt', 'local', 'fake_toolbelt', None, None),
+    ('D:/projects/toolbelt/', 'local', 'toolbelt', None, None),
+    ('mypackage', 'package', 'mypackage', None, None),
+    ('mypackage@1.0.0', 'package', 'mypackage', None, '1.0.0'),
+)
 
-@dataclass
-class ParseTestCase:
-    """Test case for source parsing."""
+_UV_CASES: tuple[tuple[SourceSpec, str], ...] = (
+    (
+        SourceSpec(source_type='github', name='repo', org='org', project_name='repo'),
+        'git+https://github.com/org/repo.git',
+    ),
+    (
+        SourceSpec(source_type='github', name='repo', org='org', version='v1.0.0', project_name='repo'),
+        'git+https://github.com/org/repo.git@v1.0.0',
+    ),
+    (
+        SourceSpec(source_type='package', name='mypackage', project_name='mypackage'),
+        'mypackage',
+    ),
+    (
+        SourceSpec(source_type='package', name='mypackage', version='1.0.0', project_name='mypackage'),
+        'mypackage==1.0.0',
+    ),
+)
 
-    source: str
-    expected_type: str
-    expected_name: str
-    expected_org: str | None = None
-    expected_version: str | None = None
 
+class TestParseSource:
+    """Tests for parse_source function."""
 
-@dataclass
-class UVSpecTestCase:
-    """Test case for UV spec building."""
+    @pytest.mark.parametrize(
+        ('source', 'expected_type', 'expected_name', 'expected_org', 'expected_version'),
+        PARSE_CASES,
+        ids=[case[0] for case in PARSE_CASES],
+    )
+    def test_parse_source_valid(
+        self,
+        source: str,
+        expected_type: str,
+        expected_name: str,
+        expected_org: str | None,
+        expected_version: str | None,
+    ) -> None:
+        """Test parsing valid source specifications."""
+        result = argparse_source(source)
 
-    spec: SourceSpec
-    expected: str
+        assert result.source_type == expected_type
+        assert result.name == expected_name
+        assert result.org == expected_org
+        assert result.version == expected_version
 
+    @pytest.mark.parametrize(
+        'source',
+        [
+            'github:',
+            'github:org',
+            'github:/repo',
+            'github:org/',
+            'github:org/repo/extra',
+            'github:org/repo@',
+            '@1.0.0',
+            'mypackage@',
+        ],
+    )
+    def test_parse_source_invalid(self, source: str) -> None:
+        """Test invalid source specifications are rejected."""
+        with pytest.raises(argparse.ArgumentTypeError, match='Invalid'):
+            argparse_source(source)
 
-class TestParseSource:
-    """Tests for parse_source function."""
+
+class TestBuildUVInstallSpec:
+    """Tests for build_uv_install_spec function."""
+
+    @pytest.mark.parametrize(
+        ('spec', 'expected'),
+        _UV_CASES,
+        ids=[case[1] for case in _UV_CASES],
+    )
+    def test_build_uv_install_spec(self, spec: SourceSpec, expected: str) -> None:
+        """Test UV install specs for remote sources."""
+        assert build_uv_install_spec(spec) == expected
+
+    def test_build_uv_install_spec_local_resolves_path(self, tmp_path: Path) -> None:
+        """Test local sources resolve to an absolute path."""
+        spec = SourceSpec(
+            source_type='local',
+            name='project',
+            local_path=str(tmp_path),
+            project_name='project',
+        )
+        assert build_uv_install_spec(spec) == str(tmp_path.resolve())
+
+
+class TestSourceSpecConversion:
+    """Tests for converting parsed sources into SourceSpec objects."""
+
+    def test_parse_source_reuses_spec_for_equal_inputs(self) -> None:
+        """Test equal sources map to the same cached SourceSpec."""
+        first = parse_source(argparse_source('github:org/repo@v1.0.0'))
+        second = parse_source(argparse_source('github:org/repo@v1.0.0'))
+        renamed = parse_source(
+            argparse_source('github:org/repo@v1.0.0'),
+            project_name='other',
+        )
+
+        assert first is second
+        assert renamed.project_name == 'other'
+        assert first.project_name == 'repo'
+
+
+class TestCreatePkglinkContext:
+    """Tests for create_pkglink_context function."""
 
     @pytest.mark.parametrize(
-        'case',
+        ('global_verbosity', 'entry_verbose', 'expect_spec'),
         [
-            ParseTestCase(
-                source='github:myorg/myrepo',
-                expected_type='github',
-                expected_name='myrepo',
-                expected_org='myorg',
-            ),
-            ParseTestCase(
-                source='github:myorg/myrepo@v1.0.0',
-                expected_type='github',
-                expected_name='myrepo',
-                expected_org='myorg',
-                expected_version='v1.0.0',
-            ),
-            ParseTestCase(
-                source='./local/path',
-                expected_type='local',
-                expected_name='path',
-            ),
-            ParseTestCase(
-                source='/absolute/path',
-                expected_type='local',
-                expected_name='path',
-            ),
-            ParseTestCase(
-                source='~/home/path',
-                expected_type='local',
-                expected_name='path',
-            ),
-            ParseTestCase(
-                source='C:\\\\Users\\\\test\\\\fake_toolbelt',
-                expected_type='local',
-                expected_name='fake_toolbelt',
-            ),
-            ParseTestCase(
-                source='mypackage',
-                expected_type='package',
-                expected_name='mypackage',
-            ),
-            ParseTestCase(
-                source='mypackage@1.0.0',
-                expected_type='package',
-                expected_name='mypackage',
-                expected_version='1.0.0',
-            ),
+            pytest.param(0, 0, False, id='quiet'),
+            pytest.param(1, 1, True, id='verbose'),
+            pytest.param(1, 0, True, id='global-verbose-entry-quiet'),
+            pytest.param(0, 1, False, id='global-quiet-entry-verbose'),
         ],
     )
-    def test_parse_source_valid(self, case: ParseTestCase) -> None:
-        """Test parsing valid source specifications."""
-        result = argparse_source(case.source)
+    def test_verbose_source_spec_follows_global_verbosity(
+        self,
+        mocker: MockerFixture,
+        monkeypatch: pytest.MonkeyPatch,
+        global_verbosity: int,
+        entry_verbose: int,
+        *,
+        expect_spec: bool,
+    ) -> None:
+        """Test the source spec dump follows hotlog's verbosity, not per-entry args."""
+        monkeypatch.setattr(get_config(), 'verbosity_level', global_verbosity)
+        mock_logger = mocker.patch.object(parsing, 'logger')
+        args = PkglinkCliArgs(source=argparse_source('mypackage'), verbose=entry_verbose)
+
+        create_pkglink_context(args)
+
+        kwargs = mock_logger.debug.call_args.kwargs
+        assert ('_verbose_source_spec' in kwargs) is expect_spec
+
+    def test_resolved_symlink_name_follows_model_copy(self) -> None:
+        """Test a copied context reports the symlink name of its own arguments."""
+        context = create_pkglink_context(PkglinkCliArgs(source=argparse_source('mypackage')))
+        assert context.resolved_symlink_name == '.mypackage'
 
-        assert result.source_type == case.expected_type
-        assert result.name == case.expected_name
-        assert result.org == case.expected_org
-        assert result.version == case.expected_version
+        copied = context.model_copy(
+            update={'cli_args': PkglinkCliArgs(source=argparse_source('mypackage'), symlink_name='.custom')},
+        )
+        assert copied.resolved_symlink_name == '.custom'
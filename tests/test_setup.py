@@ -2,12 +2,37 @@
 
 from pathlib import Path
 
-import yaml
+import pytest
+from pytest_mock import MockerFixture
 
+from pkglink import setup
+from pkglink.argparse import argparse_source
+from pkglink.cli.common import run_post_install_from_plan
+from pkglink.models import ExecutionPlan, PkglinkCliArgs
+from pkglink.parsing import create_pkglink_context
 from pkglink.setup import (
     run_post_install_setup,
 )
 
+_CONFIG_YAML = 'symlinks:\n- source: configs/.editorconfig\n  target: .editorconfig\n'
+
+
+def _scaffold(linked_path: Path, config: str = _CONFIG_YAML) -> Path:
+    """Create a linked directory holding configs/.editorconfig and pkglink.yaml."""
+    (linked_path / 'configs').mkdir(parents=True)
+    (linked_path / 'configs' / '.editorconfig').write_bytes(b'root = true')
+    (linked_path / 'pkglink.yaml').write_bytes(config.encode())
+    return linked_path
+
+
+@pytest.fixture(scope='session')
+def prebuilt_linked(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Linked directory with a config and one source file, built once per session.
+
+    Tests must treat it as read-only and use their own ``tmp_path`` as base_dir.
+    """
+    return _scaffold(tmp_path_factory.mktemp('prebuilt') / '.codeguide')
+
 
 class TestPostInstallSetup:
     """Tests for post-install setup functionality."""
@@ -21,6 +46,19 @@ class TestPostInstallSetup:
         created = run_post_install_setup(linked_path, tmp_path)
         assert created == []
 
+    def test_unreadable_config_is_reported(self, tmp_path: Path, mocker: MockerFixture) -> None:
+        """Test a config path that cannot be opened is reported as a setup failure."""
+        linked_path = tmp_path / '.codeguide'
+        (linked_path / 'pkglink.yaml').mkdir(parents=True)
+        mock_logger = mocker.patch.object(setup, 'logger')
+
+        created = run_post_install_setup(linked_path, tmp_path)
+
+        assert created == []
+        mock_logger.warning.assert_called_once()
+        assert mock_logger.warning.call_args.args == ('post_install_setup_failed',)
+        mock_logger.debug.assert_not_called()
+
     def test_empty_config_file(self, tmp_path: Path) -> None:
         """Test with empty pkglink.yaml."""
         linked_path = tmp_path / '.codeguide'
@@ -33,28 +71,20 @@ class TestPostInstallSetup:
         created = run_post_install_setup(linked_path, tmp_path)
         assert created == []
 
-    def test_create_symlinks(self, tmp_path: Path) -> None:
-        """Test creating symlinks from configuration."""
-        linked_path = tmp_path / '.codeguide'
-        linked_path.mkdir()
-
-        # Create source files
-        configs_dir = linked_path / 'configs'
-        configs_dir.mkdir()
-        editor_config = configs_dir / '.editorconfig'
-        editor_config.write_text('root = true')
+    def test_unknown_config_keys_are_rejected(self, tmp_path: Path) -> None:
+        """Test unsupported keys fail setup instead of being silently ignored."""
+        linked_path = _scaffold(
+            tmp_path / '.codeguide',
+            config=_CONFIG_YAML + '  mode: copy\n',
+        )
 
-        # Create pkglink.yaml
-        config_file = linked_path / 'pkglink.yaml'
-        config_data = {
-            'symlinks': [
-                {'source': 'configs/.editorconfig', 'target': '.editorconfig'},
-            ],
-        }
-        config_file.write_text(yaml.dump(config_data))
-
-        # Run setup
         created = run_post_install_setup(linked_path, tmp_path)
+        assert created == []
+        assert not (tmp_path / '.editorconfig').exists()
+
+    def test_create_symlinks(self, tmp_path: Path, prebuilt_linked: Path) -> None:
+        """Test creating symlinks from configuration."""
+        created = run_post_install_setup(prebuilt_linked, tmp_path)
 
         # Check that symlink was created
         target_file = tmp_path / '.editorconfig'
@@ -66,3 +96,55 @@ class TestPostInstallSetup:
                 'target': '.editorconfig',
             },
         ]
+
+    def test_create_symlinks_reports_entries_in_config_order(self, tmp_path: Path) -> None:
+        """Test every entry of a multi-link config is created and reported in config order."""
+        linked_path = tmp_path / '.codeguide'
+        (linked_path / 'configs').mkdir(parents=True)
+        names = ['.editorconfig', '.gitignore', 'pyproject.toml', 'ruff.toml']
+        for name in names:
+            (linked_path / 'configs' / name).write_text(name)
+        entries = ''.join(f'  - source: configs/{name}\n    target: {name}\n' for name in names)
+        (linked_path / 'pkglink.yaml').write_text(f'symlinks:\n{entries}')
+
+        created = run_post_install_setup(linked_path, tmp_path)
+
+        assert [entry['target'] for entry in created] == names
+        for name in names:
+            assert (tmp_path / name).read_text() == name
+
+    def test_failure_stops_remaining_symlinks(self, tmp_path: Path) -> None:
+        """Test a failing entry leaves later entries uncreated."""
+        linked_path = tmp_path / '.codeguide'
+        (linked_path / 'configs').mkdir(parents=True)
+        for name in ('b', 'c'):
+            (linked_path / 'configs' / name).write_text(name)
+        entries = ''.join(f'  - source: configs/{name}\n    target: {name}\n' for name in ('a', 'b', 'c'))
+        (linked_path / 'pkglink.yaml').write_text(f'symlinks:\n{entries}')
+
+        created = run_post_install_setup(linked_path, tmp_path)
+
+        assert created == []
+        assert not (tmp_path / 'b').exists()
+        assert not (tmp_path / 'c').exists()
+
+
+class TestRunPostInstallFromPlan:
+    """Tests for running post-install setup from an execution plan."""
+
+    def test_uses_explicit_cwd(self, tmp_path: Path) -> None:
+        """Test links are resolved against the given cwd without chdir."""
+        _scaffold(tmp_path / '.pkglink' / '.mypackage')
+        context = create_pkglink_context(
+            PkglinkCliArgs(source=argparse_source('mypackage'), inside_pkglink=True),
+        )
+
+        created = run_post_install_from_plan(ExecutionPlan(context=context), cwd=tmp_path)
+
+        assert (tmp_path / '.editorconfig').read_text() == 'root = true'
+        assert created == [
+            {
+                'source': str(Path('configs') / '.editorconfig'),
+                'target': '.editorconfig',
+            },
+        ]
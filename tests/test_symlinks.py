@@ -0,0 +1,224 @@
+"""Tests for pkglink symlink utilities."""
+
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from pkglink import symlinks
+from pkglink.symlinks import create_symlink, remove_target, supports_symlinks
+
+_NAME_MISMATCH_RE = re.compile('name mismatch')
+
+
+def _mk_symlink(link: Path, target: Path) -> None:
+    """Create a directory symlink without the pathlib wrapper."""
+    os.symlink(target, link, target_is_directory=True)  # noqa: PTH211 - direct syscall, no pathlib wrapper
+
+
+def _unexpected_removal(target: Path, **_: object) -> None:
+    msg = f'remove_target should not be called for {target}'
+    raise AssertionError(msg)
+
+
+@pytest.fixture
+def source_dir(tmp_path: Path) -> Path:
+    source = tmp_path / 'source' / 'resources'
+    os.makedirs(source)  # noqa: PTH103 - plain syscall wrapper in test setup
+    return source
+
+
+class TestSupportsSymlinks:
+    """Tests for supports_symlinks function."""
+
+    def test_supports_symlinks_false_without_os_symlink(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test symlinks are reported unsupported when os.symlink is missing."""
+        monkeypatch.setattr(symlinks, '_SUPPORTS_SYMLINKS', False)
+        assert supports_symlinks() is False
+
+    @pytest.mark.skipif(os.name == 'nt', reason='Windows probes symlink permissions')
+    def test_supports_symlinks_true(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test symlinks are reported supported when os.symlink is available."""
+        monkeypatch.setattr(symlinks, '_SUPPORTS_SYMLINKS', True)
+        assert supports_symlinks() is True
+
+
+class TestCreateSymlink:
+    """Tests for create_symlink function."""
+
+    def test_existing_link_to_source_is_kept(
+        self,
+        tmp_path: Path,
+        source_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a forced relink is skipped when the link already matches."""
+        target = tmp_path / '.mypackage'
+        _mk_symlink(target, source_dir)
+        monkeypatch.setattr(symlinks, 'remove_target', _unexpected_removal)
+
+        assert create_symlink(source_dir, target, force=True) is True
+
+        assert target.resolve() == source_dir.resolve()
+
+    def test_relative_link_to_source_is_kept(
+        self,
+        tmp_path: Path,
+        source_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test links that differ only in spelling still hit the fast path."""
+        target = tmp_path / '.mypackage'
+        _mk_symlink(target, Path('source') / 'resources')
+        monkeypatch.setattr(symlinks, 'remove_target', _unexpected_removal)
+
+        assert create_symlink(source_dir, target, force=True) is True
+
+    def test_link_to_other_source_is_replaced(
+        self,
+        tmp_path: Path,
+        source_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a forced relink replaces a link pointing elsewhere."""
+        other = tmp_path / 'other'
+        other.mkdir()
+        target = tmp_path / '.mypackage'
+        _mk_symlink(target, other)
+        monkeypatch.chdir(tmp_path)
+
+        assert create_symlink(source_dir, target, force=True) is True
+
+        assert target.resolve() == source_dir.resolve()
+
+    def test_dangling_link_is_replaced(
+        self,
+        tmp_path: Path,
+        source_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a forced relink replaces a link whose destination is gone."""
+        target = tmp_path / '.mypackage'
+        _mk_symlink(target, tmp_path / 'missing')
+        monkeypatch.chdir(tmp_path)
+
+        assert create_symlink(source_dir, target, force=True) is True
+
+        assert target.resolve() == source_dir.resolve()
+
+    def test_dangling_link_without_force_raises(self, tmp_path: Path, source_dir: Path) -> None:
+        """Test a dangling link still counts as an existing target."""
+        target = tmp_path / '.mypackage'
+        _mk_symlink(target, tmp_path / 'missing')
+
+        with pytest.raises(FileExistsError, match='Target already exists'):
+            create_symlink(source_dir, target)
+
+    def test_fallback_copy_links_files(
+        self,
+        tmp_path: Path,
+        source_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test the copy fallback hard-links files from the source tree."""
+        (source_dir / 'config.yaml').write_text('key: value')
+        monkeypatch.setattr(symlinks, 'supports_symlinks', lambda: False)
+        target = tmp_path / '.mypackage'
+
+        assert create_symlink(source_dir, target) is False
+
+        copied = target / 'config.yaml'
+        assert not target.is_symlink()
+        assert copied.read_text() == 'key: value'
+        assert copied.stat().st_ino == (source_dir / 'config.yaml').stat().st_ino
+
+    def test_fallback_copy_without_hardlinks(
+        self,
+        tmp_path: Path,
+        source_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test files are copied when hard links cannot be created."""
+        source_file = source_dir / 'config.yaml'
+        source_file.write_text('key: value')
+        monkeypatch.setattr(symlinks, 'supports_symlinks', lambda: False)
+
+        def _no_link(src: str, dst: str) -> None:
+            raise OSError(src, dst)
+
+        monkeypatch.setattr(symlinks.os, 'link', _no_link)
+        target = tmp_path / 'config.yaml'
+
+        assert create_symlink(source_file, target) is False
+
+        assert target.read_text() == 'key: value'
+        assert target.stat().st_ino != source_file.stat().st_ino
+
+
+class TestRemoveTarget:
+    """Tests for remove_target function."""
+
+    @pytest.fixture(autouse=True)
+    def inside_tmp_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Run each test from tmp_path so targets pass the cwd safety check."""
+        monkeypatch.chdir(tmp_path)
+
+    def test_removes_symlink_only(self, tmp_path: Path, source_dir: Path) -> None:
+        """Test removing a symlink leaves its destination untouched."""
+        target = tmp_path / '.mypackage'
+        _mk_symlink(target, source_dir)
+
+        remove_target(target, expected_name='.mypackage')
+
+        assert not target.is_symlink()
+        assert source_dir.is_dir()
+
+    def test_removes_copied_directory(self, tmp_path: Path) -> None:
+        """Test removing a directory copy deletes the whole tree."""
+        target = tmp_path / '.mypackage'
+        (target / 'nested').mkdir(parents=True)
+        (target / 'nested' / 'file.txt').write_text('data')
+
+        remove_target(target, expected_name='.mypackage')
+
+        assert not target.exists()
+
+    def test_refuses_git_contents(self, tmp_path: Path) -> None:
+        """Test nothing inside a .git directory is ever removed."""
+        target = tmp_path / '.git' / 'config'
+        target.parent.mkdir()
+        target.write_text('[core]')
+
+        with pytest.raises(ValueError, match=r'Refusing to remove \.git'):
+            remove_target(target, expected_name='config')
+
+        assert target.exists()
+
+    @pytest.mark.parametrize(
+        ('target_name', 'expected_name'),
+        [
+            ('.mypackage', '.otherpackage'),
+            ('.mypackage', 'mypackage'),
+            ('mypackage', '.mypackage'),
+            ('.MyPackage', '.mypackage'),
+        ],
+    )
+    def test_refuses_name_mismatch(self, tmp_path: Path, target_name: str, expected_name: str) -> None:
+        """Test a target whose name differs from the expected name is kept."""
+        target = tmp_path / target_name
+        target.write_text('data')
+
+        with pytest.raises(ValueError, match=_NAME_MISMATCH_RE):
+            remove_target(target, expected_name=expected_name)
+
+        assert target.exists()
+
+    def test_removes_file(self, tmp_path: Path) -> None:
+        """Test removing a copied file."""
+        target = tmp_path / '.editorconfig'
+        target.write_text('root = true')
+
+        remove_target(target, expected_name='.editorconfig')
+
+        assert not target.exists()